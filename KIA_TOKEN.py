@@ -27,8 +27,15 @@ import tempfile
 import locale
 import argparse
 import signal
+import threading
 from pathlib import Path
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, List, Tuple
+from urllib.parse import urlsplit
+
+# Modules only needed after Chrome is up or by optional features (ssl,
+# socket, http.server, requests, websocket) are imported where they are
+# used to keep startup fast, especially for the PyInstaller .exe.
+# tools/import_budget.py checks this.
 
 # ---------------------------------------------------------------------------
 # Python version gate
@@ -41,7 +48,7 @@ if sys.version_info < (3, 8):
 # ---------------------------------------------------------------------------
 # Constants
 # ---------------------------------------------------------------------------
-SCRIPT_VERSION = "2.5.2"
+SCRIPT_VERSION = "2.6.0"
 
 CLIENT_ID = "fdc85c00-0a2f-4c64-bcb4-2cfb1500730a"
 CLIENT_ID_LOGIN = "peukiaidm-online-sales"
@@ -66,6 +73,24 @@ CHROME_STARTUP_TIMEOUT = 20
 LOGIN_TIMEOUT = 300  # 5 minutes
 REDIRECT_TIMEOUT = 60
 TOKEN_EXCHANGE_RETRIES = 3
+POLL_MIN_INTERVAL = 0.25  # seconds, right after start / navigation
+POLL_MAX_INTERVAL = 1.0   # seconds, when nothing is happening
+POLL_BACKOFF = 1.5
+POLL_SLICE = 0.1          # granularity for noticing Enter / Chrome exit
+PREFLIGHT_DNS_TIMEOUT = 5
+PREFLIGHT_TIMEOUT = 5     # TCP + TLS, per host
+PREFLIGHT_SLOW_MS = 1500
+
+REMOTE_PORT = 8765
+REMOTE_WINDOW_SIZE = "500,900"
+SCREENCAST_MAX_FPS = 5
+SCREENCAST_QUALITY = 50   # JPEG quality, 0-100
+SCREENCAST_MAX_SIZE = 1000  # px, longest side
+
+HA_DOMAIN = "kia_uvo"
+HA_BRAND_KIA = 1       # kia_uvo also holds Hyundai (2) and Genesis (3) accounts
+HA_REGION_EUROPE = 1
+HA_CONFIG_ENTRIES = Path(".storage") / "core.config_entries"
 
 # ---------------------------------------------------------------------------
 # Argument parsing
@@ -89,6 +114,45 @@ def parse_args() -> argparse.Namespace:
         default=CDP_PORT,
         help=f"Chrome remote debugging port (default: {CDP_PORT})",
     )
+    parser.add_argument(
+        "--preflight",
+        action="store_true",
+        help="Check DNS/TCP/TLS reachability of the Kia hosts before opening "
+             "Chrome and abort early if the network blocks them",
+    )
+    parser.add_argument(
+        "--remote",
+        action="store_true",
+        help="Run Chrome headless and show the login page in your own browser "
+             "through a small web page (for servers without a display)",
+    )
+    parser.add_argument(
+        "--remote-bind",
+        metavar="ADDR",
+        default="127.0.0.1",
+        help="Address for the --remote web page (default: 127.0.0.1, use an SSH tunnel)",
+    )
+    parser.add_argument(
+        "--remote-port",
+        type=int,
+        default=REMOTE_PORT,
+        help=f"Port for the --remote web page (default: {REMOTE_PORT})",
+    )
+    parser.add_argument(
+        "--ha-config",
+        metavar="DIR",
+        action="append",
+        default=[],
+        help="Home Assistant config directory whose kia_uvo entry should get the "
+             "new refresh token (repeat for several instances; stop HA first)",
+    )
+    parser.add_argument(
+        "--ha-username",
+        metavar="EMAIL",
+        default=None,
+        help="Only update the Kia EU kia_uvo entry with this username "
+             "(required if an HA instance has more than one)",
+    )
     parser.add_argument(
         "--version",
         action="version",
@@ -152,6 +216,247 @@ def build_redirect_url() -> str:
     )
 
 
+# ---------------------------------------------------------------------------
+# Network pre-flight diagnostics
+# ---------------------------------------------------------------------------
+
+def preflight_hosts() -> List[Dict[str, Any]]:
+    """Return the hosts the login flow depends on, derived from the URL constants."""
+    hosts = []
+    for role, url in (
+        ("IdP / token", BASE_URL),
+        ("Login redirect", LOGIN_REDIRECT),
+        ("OAuth redirect", REDIRECT_URL_FINAL),
+    ):
+        parts = urlsplit(url)
+        hosts.append({"role": role, "host": parts.hostname, "port": parts.port or 443})
+    return hosts
+
+
+def detect_proxy(host: str) -> Optional[str]:
+    """Return the HTTPS proxy URL used for `host`, or None.
+
+    Looks at HTTPS_PROXY/NO_PROXY and the Windows/macOS system settings,
+    like urllib does. Proxy auto-config (PAC) scripts are not evaluated.
+    """
+    import urllib.request
+
+    proxy = urllib.request.getproxies().get("https")
+    if not proxy or urllib.request.proxy_bypass(host):
+        return None
+    return proxy if "://" in proxy else f"http://{proxy}"
+
+
+def _proxy_connect(sock: Any, host: str, port: int, proxy: str) -> None:
+    """Open a CONNECT tunnel to host:port through an already connected proxy socket."""
+    import base64
+
+    request = f"CONNECT {host}:{port} HTTP/1.1\r\nHost: {host}:{port}\r\n"
+    parts = urlsplit(proxy)
+    if parts.username:
+        credentials = f"{parts.username}:{parts.password or ''}"
+        request += f"Proxy-Authorization: Basic {base64.b64encode(credentials.encode()).decode()}\r\n"
+    sock.sendall((request + "\r\n").encode())
+
+    response = b""
+    while b"\r\n\r\n" not in response and len(response) < 8192:
+        chunk = sock.recv(1024)
+        if not chunk:
+            break
+        response += chunk
+    status_line = response.split(b"\r\n", 1)[0].decode(errors="replace")
+    fields = status_line.split()
+    if len(fields) < 2 or fields[1] != "200":
+        raise ConnectionError(f"proxy answered: {status_line or 'nothing'}")
+
+
+def check_host(host: str, port: int, timeout: float = PREFLIGHT_TIMEOUT,
+               proxy: Optional[str] = None) -> Dict[str, Any]:
+    """Resolve, connect and TLS-handshake a single host, timing each step (ms).
+
+    Like socket.create_connection, every resolved address is tried in turn
+    (a broken IPv6 route falls back to IPv4, as in Chrome). `timeout` is the
+    budget for the TCP and TLS steps together; getaddrinfo itself cannot be
+    interrupted, run_preflight() stops waiting for it.
+
+    With `proxy` (an http:// URL), DNS and TCP go to the proxy, a CONNECT
+    tunnel is opened ('proxy_ms') and the TLS handshake runs through it.
+
+    Stops at the first failing step; the step name and error are stored in
+    'failed' and 'error'. 'auth_required' is set if the proxy wants
+    credentials that were not given, so the host could not be checked.
+    """
+    import socket
+    import ssl
+
+    result: Dict[str, Any] = {
+        "dns_ms": None, "tcp_ms": None, "proxy_ms": None, "tls_ms": None,
+        "failed": None, "error": None, "auth_required": False,
+    }
+
+    connect_host, connect_port = host, port
+    if proxy:
+        parts = urlsplit(proxy)
+        connect_host, connect_port = parts.hostname, parts.port or 8080
+
+    step = "DNS"
+    try:
+        start = time.monotonic()
+        infos = socket.getaddrinfo(connect_host, connect_port, type=socket.SOCK_STREAM)
+        result["dns_ms"] = (time.monotonic() - start) * 1000
+        deadline = time.monotonic() + timeout
+
+        step = "TCP"
+        sock = None
+        error: Optional[Exception] = None
+        for family, socktype, proto, _, addr in infos:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                error = socket.timeout("timed out")
+                break
+            sock = socket.socket(family, socktype, proto)
+            sock.settimeout(remaining)
+            try:
+                start = time.monotonic()
+                sock.connect(addr)
+                result["tcp_ms"] = (time.monotonic() - start) * 1000
+                break
+            except OSError as e:
+                error = e
+                sock.close()
+                sock = None
+        if sock is None:
+            raise error or OSError("no addresses")
+
+        try:
+            if proxy:
+                step = "PROXY"
+                sock.settimeout(max(deadline - time.monotonic(), 0.1))
+                start = time.monotonic()
+                try:
+                    _proxy_connect(sock, host, port, proxy)
+                except ConnectionError as e:
+                    result["auth_required"] = " 407" in str(e)
+                    raise
+                result["proxy_ms"] = (time.monotonic() - start) * 1000
+
+            step = "TLS"
+            sock.settimeout(max(deadline - time.monotonic(), 0.1))
+            context = ssl.create_default_context()
+            start = time.monotonic()
+            with context.wrap_socket(sock, server_hostname=host):
+                result["tls_ms"] = (time.monotonic() - start) * 1000
+        finally:
+            sock.close()
+    except Exception as e:
+        result["failed"] = step
+        result["error"] = str(e) or type(e).__name__
+
+    return result
+
+
+def estimate_redirect_latency(results: List[Dict[str, Any]]) -> Optional[float]:
+    """Rough cost (ms) of the authorize -> OAuth redirect hop.
+
+    Chrome has to open a fresh connection to both the IdP and the redirect
+    host and do one request round trip on each; the TCP connect time is used
+    as the round-trip estimate.
+    """
+    total = 0.0
+    for r in results:
+        if r["role"] not in ("IdP / token", "OAuth redirect"):
+            continue
+        if r["failed"]:
+            return None
+        total += r["dns_ms"] + 2 * r["tcp_ms"] + (r["proxy_ms"] or 0) + r["tls_ms"]
+    return total
+
+
+def run_preflight() -> bool:
+    """Check all Kia hosts in parallel and print a timing table.
+
+    Returns False if any host is unreachable (the login cannot finish on this
+    network); slow hosts only produce a warning.
+    """
+    hosts = preflight_hosts()
+    print(f"[INFO] Pre-flight: checking {len(hosts)} hosts (DNS / TCP / TLS)...")
+
+    # Chrome uses the system proxy, so check through it as well
+    for h in hosts:
+        h["proxy"] = detect_proxy(h["host"])
+    proxies = sorted({h["proxy"] for h in hosts if h["proxy"]})
+    if proxies:
+        shown = ", ".join(f"{urlsplit(p).hostname}:{urlsplit(p).port or 8080}" for p in proxies)
+        print(f"  Proxy detected: {shown} — checking through it")
+
+    # Daemon threads rather than a ThreadPoolExecutor: a hung resolver must
+    # neither stall the run nor block interpreter exit. Hosts that have not
+    # finished after the DNS allowance plus the TCP/TLS budget are reported.
+    checks: Dict[int, Dict[str, Any]] = {}
+
+    def _check(i: int, host: Dict[str, Any]) -> None:
+        checks[i] = check_host(host["host"], host["port"], proxy=host["proxy"])
+
+    threads = [threading.Thread(target=_check, args=(i, h), daemon=True) for i, h in enumerate(hosts)]
+    for t in threads:
+        t.start()
+    deadline = time.monotonic() + PREFLIGHT_DNS_TIMEOUT + PREFLIGHT_TIMEOUT
+    for t in threads:
+        t.join(max(deadline - time.monotonic(), 0))
+
+    results = []
+    for i, h in enumerate(hosts):
+        if i in checks:
+            results.append(dict(h, **checks[i]))
+        else:
+            results.append(dict(h, dns_ms=None, tcp_ms=None, proxy_ms=None, tls_ms=None,
+                                failed="DNS", error="timed out", auth_required=False))
+
+    def _ms(value: Optional[float]) -> str:
+        return "-" if value is None else f"{value:.0f}ms"
+
+    ok = True
+    slow = False
+    unchecked = False
+    for r in results:
+        target = f"{r['host']}:{r['port']}"
+        if r["auth_required"]:
+            unchecked = True
+            print(f"  [WARN] {r['role']:<15} {target:<36} not checked: {r['error']}")
+            continue
+        if r["failed"]:
+            ok = False
+            print(f"  [FAIL] {r['role']:<15} {target:<36} {r['failed']} failed: {r['error']}")
+            continue
+        total = r["dns_ms"] + r["tcp_ms"] + (r["proxy_ms"] or 0) + r["tls_ms"]
+        if total > PREFLIGHT_SLOW_MS:
+            slow = True
+        via = f"  proxy {_ms(r['proxy_ms'])}" if r["proxy"] else ""
+        print(f"  [OK]   {r['role']:<15} {target:<36} "
+              f"dns {_ms(r['dns_ms'])}  tcp {_ms(r['tcp_ms'])}{via}  tls {_ms(r['tls_ms'])}")
+
+    latency = estimate_redirect_latency(results)
+    if latency is not None:
+        print(f"  Estimated OAuth redirect latency: ~{latency:.0f}ms")
+    print()
+
+    if not ok:
+        print("[ERROR] Pre-flight failed — the login cannot complete on this network.")
+        print("  - A firewall/proxy may be blocking the host(s) above (often port 8080)")
+        print("  - Try a different network (e.g. mobile hotspot) or disable the VPN")
+        print("  - If your network uses a proxy auto-config (PAC) script, set HTTPS_PROXY")
+        print("    or run without --preflight")
+        return False
+
+    if unchecked:
+        print("[WARN] The proxy requires authentication — some hosts could not be checked.\n")
+
+    if slow:
+        print(f"[WARN] Some hosts took over {PREFLIGHT_SLOW_MS}ms — the redirect may be slow.\n")
+
+    return True
+
+
 # ---------------------------------------------------------------------------
 # Chrome path detection
 # ---------------------------------------------------------------------------
@@ -197,16 +502,31 @@ def get_chrome_path() -> Optional[str]:
 
 def ensure_dependencies() -> bool:
     """
-    Ensure 'requests' and 'websocket-client' are importable.
+    Ensure 'requests' and 'websocket-client' are installed.
     If not, create a local venv, install them, and re-exec this script inside it.
+
+    Only looks the packages up (no import); preload_dependencies() loads
+    them in the background and require_dependencies() repairs a broken
+    install that only shows up on import.
     """
-    try:
-        import requests  # noqa: F401
-        import websocket  # noqa: F401
+    if getattr(sys, "frozen", False):
+        return True  # PyInstaller build, everything is bundled
+
+    import importlib.util
+    if all(importlib.util.find_spec(name) for name in ("requests", "websocket")):
         return True
-    except ImportError:
-        pass
 
+    install_dependencies()
+    return True
+
+
+def install_dependencies(restart: bool = False) -> None:
+    """Install 'requests' and 'websocket-client'.
+
+    Inside a venv they are installed directly (and the script restarted if
+    `restart` is set); otherwise a local .venv is created and the script
+    re-executed inside it.
+    """
     in_venv = hasattr(sys, "real_prefix") or (
         hasattr(sys, "base_prefix") and sys.base_prefix != sys.prefix
     )
@@ -217,7 +537,10 @@ def ensure_dependencies() -> bool:
         subprocess.check_call(
             [sys.executable, "-m", "pip", "install", "-q", "requests", "websocket-client"]
         )
-        return True
+        if restart:
+            print("[INFO] Restarting script...\n")
+            restart_script(sys.executable)
+        return
 
     # Not in venv — create one, install, re-exec
     venv_dir = Path(__file__).parent / ".venv"
@@ -247,8 +570,183 @@ def ensure_dependencies() -> bool:
 
     # Re-execute this script under venv python
     print("[INFO] Restarting script inside virtual environment...\n")
-    result = subprocess.run([str(venv_python)] + sys.argv, env=os.environ.copy())
-    sys.exit(result.returncode)
+    restart_script(str(venv_python))
+
+
+def restart_script(python: str) -> None:
+    """Run this script again under `python` and exit with its exit code.
+
+    Exits with os._exit: this may be called from inside main(), and the
+    restarted run has already shown its own 'Press Enter to exit...' prompt.
+    """
+    sys.stdout.flush()
+    result = subprocess.run([python] + sys.argv, env=os.environ.copy())
+    sys.stdout.flush()
+    sys.stderr.flush()
+    os._exit(result.returncode)
+
+
+_preload_thread: Optional[threading.Thread] = None
+_preload_error: Optional[BaseException] = None
+
+
+def preload_dependencies() -> None:
+    """Import 'requests' and 'websocket' in a background thread.
+
+    They are first needed once Chrome is running, so loading them overlaps
+    with argument parsing and the Chrome launch instead of delaying it.
+    """
+    global _preload_thread
+
+    def _load() -> None:
+        global _preload_error
+        try:
+            import requests  # noqa: F401
+            import websocket  # noqa: F401
+        except Exception as e:
+            _preload_error = e  # handled by require_dependencies()
+
+    _preload_thread = threading.Thread(target=_load, daemon=True)
+    _preload_thread.start()
+
+
+def require_dependencies(chrome: Optional[subprocess.Popen] = None) -> None:
+    """Make sure 'requests' and 'websocket' can be imported before the first CDP call.
+
+    Waits for preload_dependencies() (or imports directly without it). A
+    broken install that find_spec() could not see — e.g. a missing urllib3 —
+    closes `chrome`, reinstalls the packages and restarts the script.
+    """
+    global _preload_error
+
+    if _preload_thread is not None:
+        _preload_thread.join()
+    else:
+        try:
+            import requests  # noqa: F401
+            import websocket  # noqa: F401
+        except Exception as e:
+            _preload_error = e
+
+    if _preload_error is None:
+        return
+
+    print(f"[WARN] Could not load dependencies: {_preload_error}")
+    if chrome is not None:
+        chrome.terminate()
+    if getattr(sys, "frozen", False):
+        print("[ERROR] This build is incomplete — download KIA_TOKEN.exe again.")
+        sys.exit(1)
+    install_dependencies(restart=True)
+
+
+# ---------------------------------------------------------------------------
+# Wait scheduling
+# ---------------------------------------------------------------------------
+
+CANCEL_CHROME_EXIT = "chrome_exit"
+CANCEL_ENTER = "enter"
+
+
+def enter_pressed(timeout: float = 0) -> bool:
+    """Wait up to `timeout` seconds for Enter in the terminal (consumes the input)."""
+    if sys.platform == "win32":
+        import msvcrt
+        deadline = time.monotonic() + timeout
+        while True:
+            if msvcrt.kbhit():
+                msvcrt.getwch()  # consume the keypress
+                return True
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return False
+            time.sleep(min(0.05, remaining))
+
+    import select
+    ready, _, _ = select.select([sys.stdin], [], [], timeout)
+    if ready:
+        sys.stdin.readline()
+        return True
+    return False
+
+
+class PollScheduler:
+    """Polling loop driven by a monotonic deadline with adaptive intervals.
+
+    The first wait() returns immediately, after that the interval starts at
+    POLL_MIN_INTERVAL and grows by POLL_BACKOFF up to POLL_MAX_INTERVAL;
+    kick() resets it when something changed (e.g. after a navigation).
+    Slow checks between waits count against the timeout, so a 60 s phase
+    really ends after 60 s.
+
+    Sleeping is cut short when `process` exits or (with watch_stdin) Enter
+    is pressed; wait() then returns False and `cancelled` is set to
+    CANCEL_CHROME_EXIT or CANCEL_ENTER.
+
+        poller = PollScheduler(LOGIN_TIMEOUT, process=chrome, watch_stdin=True)
+        while poller.wait():
+            if check():
+                break
+    """
+
+    def __init__(self, timeout: float, process: Optional[subprocess.Popen] = None,
+                 watch_stdin: bool = False) -> None:
+        self.process = process
+        self.watch_stdin = watch_stdin
+        self.started = time.monotonic()
+        self.deadline = self.started + timeout
+        self.interval = POLL_MIN_INTERVAL
+        self.polls = 0
+        self.cancelled: Optional[str] = None
+        self._periods: Dict[float, int] = {}
+
+    def elapsed(self) -> float:
+        return time.monotonic() - self.started
+
+    def remaining(self) -> float:
+        return max(0.0, self.deadline - time.monotonic())
+
+    def kick(self) -> None:
+        """Poll quickly again (activity was observed)."""
+        self.interval = POLL_MIN_INTERVAL
+
+    def every(self, period: float) -> bool:
+        """True once per `period` seconds of elapsed time (for progress output)."""
+        bucket = int(self.elapsed() // period)
+        if bucket > self._periods.get(period, 0):
+            self._periods[period] = bucket
+            return True
+        return False
+
+    def _check_cancel(self, timeout: float = 0) -> bool:
+        if self.process is not None and self.process.poll() is not None:
+            self.cancelled = CANCEL_CHROME_EXIT
+            return True
+        if self.watch_stdin:
+            if enter_pressed(timeout):
+                self.cancelled = CANCEL_ENTER
+                return True
+        elif timeout > 0:
+            time.sleep(timeout)
+        return False
+
+    def wait(self) -> bool:
+        """Sleep until the next poll. Returns False on timeout or cancellation."""
+        if self._check_cancel():
+            return False
+        if self.polls > 0:
+            wake = min(time.monotonic() + self.interval, self.deadline)
+            while True:
+                left = wake - time.monotonic()
+                if left <= 0:
+                    break
+                if self._check_cancel(min(POLL_SLICE, left)):
+                    return False
+            self.interval = min(self.interval * POLL_BACKOFF, POLL_MAX_INTERVAL)
+        if self.remaining() <= 0:
+            return False
+        self.polls += 1
+        return True
 
 
 # ---------------------------------------------------------------------------
@@ -266,7 +764,22 @@ def cdp_port_alive(port: int) -> bool:
         return False
 
 
+def port_open(port: int, timeout: float = 0.5) -> bool:
+    """Plain TCP check — does not need 'requests' to be loaded yet."""
+    import socket
+    try:
+        with socket.create_connection(("localhost", port), timeout=timeout):
+            return True
+    except OSError:
+        return False
+
+
 def kill_existing_debug_session(port: int) -> None:
+    # Usually nothing listens; checking that first lets Chrome launch
+    # without waiting for the 'requests' import
+    if not port_open(port):
+        return
+    require_dependencies()
     if not cdp_port_alive(port):
         return
     print(f"[WARN] Existing Chrome debug session on port {port} — closing...")
@@ -283,8 +796,12 @@ def kill_existing_debug_session(port: int) -> None:
     time.sleep(2)
 
 
-def launch_chrome(login_url: str, port: int) -> subprocess.Popen:
-    """Launch Chrome with remote debugging enabled."""
+def launch_chrome(login_url: str, port: int, headless: bool = False) -> subprocess.Popen:
+    """Launch Chrome with remote debugging enabled.
+
+    With headless=True no display is needed; the page is only reachable
+    through CDP (see ScreencastRelay).
+    """
     chrome_path = get_chrome_path()
     if not chrome_path:
         print("[ERROR] Chrome/Chromium not found.")
@@ -292,10 +809,11 @@ def launch_chrome(login_url: str, port: int) -> subprocess.Popen:
         sys.exit(1)
 
     # Check display on Linux
-    if platform.system() == "Linux":
+    if platform.system() == "Linux" and not headless:
         if not os.environ.get("DISPLAY") and not os.environ.get("WAYLAND_DISPLAY"):
             print("[ERROR] No graphical display detected (DISPLAY / WAYLAND_DISPLAY not set).")
-            print("  This script requires a desktop environment with a browser.")
+            print("  This script requires a desktop environment with a browser,")
+            print("  or use --remote to run Chrome headless and log in from another machine.")
             sys.exit(1)
 
     kill_existing_debug_session(port)
@@ -321,6 +839,15 @@ def launch_chrome(login_url: str, port: int) -> subprocess.Popen:
     if platform.system() == "Darwin":
         cmd.append("--use-mock-keychain")
 
+    if headless:
+        cmd += ["--headless=new", f"--window-size={REMOTE_WINDOW_SIZE}"]
+        # Chrome refuses to start as root unless its sandbox is disabled
+        # (typical for provisioning servers and containers)
+        if platform.system() == "Linux" and os.geteuid() == 0:
+            print("[WARN] Running as root — starting Chrome with --no-sandbox.")
+            print("  Prefer running this script as a regular user.")
+            cmd.append("--no-sandbox")
+
     cmd.append(login_url)
 
     print(f"[INFO] Launching Chrome (port {port})...")
@@ -332,13 +859,21 @@ def launch_chrome(login_url: str, port: int) -> subprocess.Popen:
 
     process = subprocess.Popen(cmd, **kwargs)
 
+    # requests/websocket were loading in the background while Chrome started
+    require_dependencies(process)
+
     # Wait for CDP to become responsive
-    for _ in range(CHROME_STARTUP_TIMEOUT):
-        time.sleep(1)
+    poller = PollScheduler(CHROME_STARTUP_TIMEOUT, process=process)
+    while poller.wait():
         if cdp_port_alive(port):
             print("[INFO] Chrome ready.\n")
             return process
 
+    if poller.cancelled == CANCEL_CHROME_EXIT:
+        print(f"[ERROR] Chrome exited during startup (exit code {process.returncode}).")
+        print("  Close other Chrome windows started with --remote-debugging-port and try again.")
+        sys.exit(1)
+
     print("[WARN] Chrome took longer than expected to start. Continuing anyway...")
     return process
 
@@ -352,20 +887,20 @@ def cdp_get_targets(port: int) -> list:
         return []
 
 
-def cdp_check_login_complete(port: int) -> bool:
+def cdp_check_login_complete(port: int, targets: Optional[list] = None) -> bool:
     """Check if any open tab contains signs of completed login.
 
     Looks for:
     - java.util.NoSuchElementException in page body (Kia backend error after login)
     - Redirect URL containing 'code=' (direct OAuth success)
     - Landing on kia.com after login (generic success)
+
+    `targets` is the /json target list if the caller already fetched it.
     """
-    import requests, websocket as ws_mod  # noqa: E401
+    import websocket as ws_mod
 
-    try:
-        targets = requests.get(f"http://localhost:{port}/json", timeout=5).json()
-    except Exception:
-        return False
+    if targets is None:
+        targets = cdp_get_targets(port)
 
     pages = [t for t in targets if t.get("type") == "page"]
 
@@ -480,6 +1015,307 @@ def cdp_find_code_url(port: int, preferred_prefix: Optional[str] = None, debug:
     return None
 
 
+# ---------------------------------------------------------------------------
+# Remote login (headless Chrome mirrored to the user's browser)
+# ---------------------------------------------------------------------------
+
+REMOTE_PAGE_HTML = """<!DOCTYPE html>
+<html><head><meta charset="utf-8"><title>Kia Token Generator - remote login</title>
+<style>
+  body { margin: 0; background: #222; color: #ccc; font: 14px sans-serif; text-align: center; }
+  p { margin: 8px; }
+  img { max-width: 100%; max-height: calc(100vh - 40px); cursor: default; outline: none; }
+</style></head>
+<body>
+<p>Click into the page and log in. Keyboard input goes to the remote browser.</p>
+<img id="screen" src="stream" tabindex="0" draggable="false" alt="Waiting for the browser...">
+<script>
+const img = document.getElementById("screen");
+let queue = Promise.resolve();
+function send(ev) {
+  // Sequential so that e.g. mouse down/up keep their order
+  queue = queue.then(() => fetch("input", {method: "POST", body: JSON.stringify(ev)})).catch(() => {});
+}
+function mods(e) {
+  return (e.altKey ? 1 : 0) | (e.ctrlKey ? 2 : 0) | (e.metaKey ? 4 : 0) | (e.shiftKey ? 8 : 0);
+}
+function pos(e) {
+  return {x: e.offsetX / img.clientWidth, y: e.offsetY / img.clientHeight};
+}
+const buttons = ["left", "middle", "right"];
+img.addEventListener("mousedown", e => {
+  e.preventDefault(); img.focus();
+  send(Object.assign({type: "mouse", action: "down", button: buttons[e.button] || "left", modifiers: mods(e)}, pos(e)));
+});
+img.addEventListener("mouseup", e => {
+  e.preventDefault();
+  send(Object.assign({type: "mouse", action: "up", button: buttons[e.button] || "left", modifiers: mods(e)}, pos(e)));
+});
+let lastMove = 0;
+img.addEventListener("mousemove", e => {
+  const now = Date.now();
+  if (now - lastMove < 50) return;
+  lastMove = now;
+  send(Object.assign({type: "mouse", action: "move", button: "none", modifiers: mods(e)}, pos(e)));
+});
+img.addEventListener("wheel", e => {
+  e.preventDefault();
+  send(Object.assign({type: "wheel", dx: e.deltaX, dy: e.deltaY}, pos(e)));
+}, {passive: false});
+img.addEventListener("contextmenu", e => e.preventDefault());
+function key(action, e) {
+  // AltGr (@, ą, € ... on EU layouts) is reported as Ctrl+Alt on Windows
+  const altGr = e.getModifierState && e.getModifierState("AltGraph");
+  if (!altGr && (e.ctrlKey || e.metaKey) && e.key === "v") return;  // let the paste event through
+  e.preventDefault();
+  const text = e.key.length === 1 ? e.key : (e.key === "Enter" ? "\\r" : "");
+  const modifiers = altGr ? mods(e) & ~3 : mods(e);
+  send({type: "key", action: action, key: e.key, code: e.code, keyCode: e.keyCode, text: text, modifiers: modifiers});
+}
+img.addEventListener("keydown", e => key("down", e));
+img.addEventListener("keyup", e => key("up", e));
+img.addEventListener("paste", e => {
+  e.preventDefault();
+  send({type: "text", text: e.clipboardData.getData("text")});
+});
+</script>
+</body></html>
+"""
+
+
+class ScreencastRelay:
+    """Mirror the first Chrome tab as JPEG frames and replay input into it.
+
+    Uses Page.startScreencast; each frame is acknowledged no faster than
+    SCREENCAST_MAX_FPS, and Chrome does not send the next frame before the
+    ack, so the frame rate is throttled at the source. Chrome also only
+    sends frames when the page changes, so an idle login page costs
+    (almost) no bandwidth.
+    """
+
+    def __init__(self, port: int, max_fps: float = SCREENCAST_MAX_FPS,
+                 quality: int = SCREENCAST_QUALITY) -> None:
+        self.port = port
+        self.max_fps = max_fps
+        self.quality = quality
+        self.frame: Optional[bytes] = None
+        self.frame_seq = 0
+        self.running = False
+        self._device_size = (0, 0)
+        self._cond = threading.Condition()
+        self._send_lock = threading.Lock()
+        self._msg_id = 0
+        self._conn = None
+
+    def start(self) -> bool:
+        import websocket as ws_mod
+
+        pages = [t for t in cdp_get_targets(self.port) if t.get("type") == "page"]
+        ws_url = pages[0].get("webSocketDebuggerUrl") if pages else None
+        if not ws_url:
+            return False
+        try:
+            self._conn = ws_mod.create_connection(ws_url, timeout=10)
+            self._conn.settimeout(None)
+            self.running = True
+            threading.Thread(target=self._read_loop, daemon=True).start()
+            self._send("Page.startScreencast", {
+                "format": "jpeg",
+                "quality": self.quality,
+                "maxWidth": SCREENCAST_MAX_SIZE,
+                "maxHeight": SCREENCAST_MAX_SIZE,
+            })
+            return True
+        except Exception as e:
+            print(f"[WARN] Could not start screencast: {e}")
+            self.stop()
+            return False
+
+    def stop(self) -> None:
+        if not self.running and self._conn is None:
+            return
+        self.running = False
+        if self._conn is not None:
+            try:
+                self._send("Page.stopScreencast")
+            except Exception:
+                pass
+            try:
+                self._conn.close()
+            except Exception:
+                pass
+            self._conn = None
+        with self._cond:
+            self._cond.notify_all()
+
+    def _send(self, method: str, params: Optional[Dict[str, Any]] = None) -> None:
+        with self._send_lock:
+            self._msg_id += 1
+            self._conn.send(json.dumps({"id": self._msg_id, "method": method, "params": params or {}}))
+
+    def _read_loop(self) -> None:
+        import base64
+
+        min_gap = 1.0 / self.max_fps
+        last_ack = 0.0
+        while self.running:
+            try:
+                msg = json.loads(self._conn.recv())
+            except Exception:
+                break
+            if msg.get("method") != "Page.screencastFrame":
+                continue
+
+            params = msg.get("params", {})
+            meta = params.get("metadata", {})
+            with self._cond:
+                self.frame = base64.b64decode(params.get("data", ""))
+                self.frame_seq += 1
+                self._device_size = (meta.get("deviceWidth", 0), meta.get("deviceHeight", 0))
+                self._cond.notify_all()
+
+            delay = last_ack + min_gap - time.monotonic()
+            if delay > 0:
+                time.sleep(delay)
+            last_ack = time.monotonic()
+            try:
+                self._send("Page.screencastFrameAck", {"sessionId": params.get("sessionId")})
+            except Exception:
+                break
+        self.running = False
+
+    def next_frame(self, after_seq: int, timeout: float) -> Tuple[int, Optional[bytes]]:
+        """Block until a frame newer than `after_seq` exists (or timeout)."""
+        with self._cond:
+            self._cond.wait_for(lambda: self.frame_seq > after_seq or not self.running, timeout)
+            if self.frame_seq > after_seq:
+                return self.frame_seq, self.frame
+            return after_seq, None
+
+    def dispatch(self, event: Dict[str, Any]) -> None:
+        """Replay one input event from the web page (see REMOTE_PAGE_HTML)."""
+        width, height = self._device_size
+        kind = event.get("type")
+        modifiers = int(event.get("modifiers", 0))
+
+        if kind in ("mouse", "wheel"):
+            x = float(event.get("x", 0)) * width
+            y = float(event.get("y", 0)) * height
+            if kind == "wheel":
+                self._send("Input.dispatchMouseEvent", {
+                    "type": "mouseWheel", "x": x, "y": y,
+                    "deltaX": float(event.get("dx", 0)), "deltaY": float(event.get("dy", 0)),
+                })
+                return
+            action = {"down": "mousePressed", "up": "mouseReleased"}.get(event.get("action"), "mouseMoved")
+            params = {"type": action, "x": x, "y": y, "modifiers": modifiers,
+                      "button": event.get("button", "none")}
+            if action != "mouseMoved":
+                params["clickCount"] = 1
+            self._send("Input.dispatchMouseEvent", params)
+
+        elif kind == "key":
+            text = event.get("text", "")
+            # A character typed with Ctrl+Alt is AltGr on Windows — send it as text
+            if len(text) == 1 and modifiers & 3 == 3 and not modifiers & 4:
+                modifiers &= ~3
+            params = {
+                "key": event.get("key", ""),
+                "code": event.get("code", ""),
+                "windowsVirtualKeyCode": int(event.get("keyCode", 0)),
+                "modifiers": modifiers,
+            }
+            if event.get("action") == "up":
+                params["type"] = "keyUp"
+            elif text and not modifiers & (2 | 4):  # no Ctrl / Meta
+                params.update(type="keyDown", text=text)
+            else:
+                params["type"] = "rawKeyDown"
+            self._send("Input.dispatchKeyEvent", params)
+
+        elif kind == "text":
+            self._send("Input.insertText", {"text": str(event.get("text", ""))})
+
+
+def start_remote_server(relay: ScreencastRelay, bind: str, port: int) -> Tuple[Any, str]:
+    """Serve the remote login page on a random secret path.
+
+    Returns (server, url). The page and its stream/input endpoints live
+    under /<token>/ so that only whoever got the URL can drive the browser.
+    """
+    import secrets
+    from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+
+    prefix = f"/{secrets.token_urlsafe(16)}/"
+
+    class Handler(BaseHTTPRequestHandler):
+        def log_message(self, *args) -> None:
+            pass
+
+        def do_GET(self) -> None:
+            if self.path == prefix:
+                body = REMOTE_PAGE_HTML.encode()
+                self.send_response(200)
+                self.send_header("Content-Type", "text/html; charset=utf-8")
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+            elif self.path == prefix + "stream":
+                self._stream()
+            else:
+                self.send_error(404)
+
+        def do_POST(self) -> None:
+            if self.path != prefix + "input":
+                self.send_error(404)
+                return
+            try:
+                length = int(self.headers.get("Content-Length", 0))
+                relay.dispatch(json.loads(self.rfile.read(length)))
+            except Exception:
+                self.send_error(400)
+                return
+            self.send_response(204)
+            self.end_headers()
+
+        def _stream(self) -> None:
+            # MJPEG: every frame replaces the previous one in the <img>
+            self.send_response(200)
+            self.send_header("Content-Type", "multipart/x-mixed-replace; boundary=frame")
+            self.send_header("Cache-Control", "no-store")
+            self.end_headers()
+            seq = 0
+            try:
+                self.wfile.write(b"--frame\r\n")
+                while relay.running:
+                    seq, frame = relay.next_frame(seq, timeout=5)
+                    if frame is None:
+                        continue
+                    # Trailing boundary right after the frame, so browsers
+                    # render it immediately instead of on the next frame
+                    self.wfile.write(
+                        b"Content-Type: image/jpeg\r\n"
+                        + f"Content-Length: {len(frame)}\r\n\r\n".encode()
+                        + frame + b"\r\n--frame\r\n"
+                    )
+                    self.wfile.flush()
+            except (BrokenPipeError, ConnectionResetError):
+                pass
+
+    server = ThreadingHTTPServer((bind, port), Handler)
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+
+    if bind in ("0.0.0.0", "::", ""):
+        import socket
+        host = socket.gethostname()
+    elif bind == "127.0.0.1":
+        host = "localhost"
+    else:
+        host = bind
+    return server, f"http://{host}:{port}{prefix}"
+
+
 # ---------------------------------------------------------------------------
 # Token exchange
 # ---------------------------------------------------------------------------
@@ -544,6 +1380,119 @@ def exchange_code_for_token(code: str) -> Optional[Dict[str, Any]]:
     return None
 
 
+# ---------------------------------------------------------------------------
+# Home Assistant config update
+# ---------------------------------------------------------------------------
+
+def apply_token_updates(entries: List[Dict[str, Any]], updates: Dict[Optional[str], str]) -> Tuple[int, int]:
+    """Store refresh tokens as the password of matching kia_uvo config entries.
+
+    Only Kia Europe entries are considered (kia_uvo also holds Hyundai,
+    Genesis and non-EU accounts). `updates` maps a Kia Connect username
+    (case-insensitive) to its refresh token; the key None matches an entry
+    without a more specific match, but only if it is the only such entry —
+    otherwise ValueError is raised and nothing is changed. Returns
+    (matched, changed) — entries that already hold the token are matched
+    but not changed.
+    """
+    by_user = {(k.lower() if k else None): v for k, v in updates.items()}
+    targets = []
+    fallback = 0
+
+    for entry in entries:
+        if entry.get("domain") != HA_DOMAIN:
+            continue
+        data = entry.get("data") or {}
+        if data.get("brand") not in (HA_BRAND_KIA, str(HA_BRAND_KIA)):
+            continue
+        if data.get("region") not in (HA_REGION_EUROPE, str(HA_REGION_EUROPE)):
+            continue
+        username = (data.get("username") or "").lower()
+        if username in by_user:
+            token = by_user[username]
+        elif None in by_user:
+            token = by_user[None]
+            fallback += 1
+        else:
+            continue
+        targets.append((entry, token))
+
+    if fallback > 1:
+        raise ValueError(f"{fallback} Kia EU {HA_DOMAIN} entries found — "
+                         f"choose one with --ha-username")
+
+    changed = 0
+    for entry, token in targets:
+        data = entry.setdefault("data", {})
+        if data.get("password") != token:
+            data["password"] = token
+            changed += 1
+
+    return len(targets), changed
+
+
+def write_json_atomic(path: Path, data: Any) -> None:
+    """Write JSON next to `path` and rename it into place (keeps file mode)."""
+    fd, tmp_name = tempfile.mkstemp(dir=str(path.parent), prefix=f".{path.name}.", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            json.dump(data, f, indent=2, ensure_ascii=False)
+            f.flush()
+            os.fsync(f.fileno())
+        if path.exists():
+            shutil.copymode(str(path), tmp_name)
+        os.replace(tmp_name, str(path))
+    except BaseException:
+        try:
+            os.unlink(tmp_name)
+        except OSError:
+            pass
+        raise
+
+
+def update_ha_config(config_dir: Path, updates: Dict[Optional[str], str]) -> Tuple[int, int]:
+    """Apply `updates` to one HA instance with a single read and (if needed) write."""
+    path = config_dir / HA_CONFIG_ENTRIES
+    with open(path, encoding="utf-8") as f:
+        store = json.load(f)
+
+    entries = store.get("data", {}).get("entries")
+    if not isinstance(entries, list):
+        raise ValueError(f"unexpected format (no data.entries list) in {path}")
+
+    matched, changed = apply_token_updates(entries, updates)
+    if changed:
+        write_json_atomic(path, store)
+    return matched, changed
+
+
+def update_ha_configs(config_dirs: List[str], updates: Dict[Optional[str], str]) -> bool:
+    """Update every given HA config directory. Returns False if any failed."""
+    print(f"[INFO] Updating Home Assistant config ({len(config_dirs)} instance(s))...")
+    ok = True
+
+    for config_dir in config_dirs:
+        try:
+            matched, changed = update_ha_config(Path(config_dir).expanduser(), updates)
+        except Exception as e:
+            print(f"  [FAIL] {config_dir}: {e}")
+            ok = False
+            continue
+        if not matched:
+            print(f"  [WARN] {config_dir}: no matching Kia EU {HA_DOMAIN} entry found")
+            ok = False
+        elif changed:
+            print(f"  [OK]   {config_dir}: {changed} entr{'y' if changed == 1 else 'ies'} updated")
+        else:
+            print(f"  [OK]   {config_dir}: already up to date")
+
+    print()
+    print("  Restart Home Assistant to load the new token. If it was running")
+    print("  during the update, it may overwrite the file — stop it first.")
+    print()
+    return ok
+
+
 # ---------------------------------------------------------------------------
 # Main
 # ---------------------------------------------------------------------------
@@ -564,12 +1513,43 @@ def main() -> None:
     login_url = build_login_url(ui_locale)
     redirect_url = build_redirect_url()
 
+    # Fail fast before the user spends minutes on the login/CAPTCHA
+    if args.preflight and not run_preflight():
+        sys.exit(1)
+
     # Launch Chrome
-    chrome = launch_chrome(login_url, port)
+    chrome = launch_chrome(login_url, port, headless=args.remote)
+
+    relay = server = None
+
+    def _stop_remote() -> None:
+        nonlocal relay, server
+        if relay:
+            relay.stop()
+            relay = None
+        if server:
+            server.shutdown()
+            server.server_close()
+            server = None
+
+    if args.remote:
+        relay = ScreencastRelay(port)
+        if not relay.start():
+            print("[ERROR] Could not attach to the headless Chrome tab.")
+            chrome.terminate()
+            sys.exit(1)
+        try:
+            server, remote_url = start_remote_server(relay, args.remote_bind, args.remote_port)
+        except OSError as e:
+            print(f"[ERROR] Could not start the remote login page on port {args.remote_port}: {e}")
+            _stop_remote()
+            chrome.terminate()
+            sys.exit(1)
 
     # Register cleanup on Ctrl+C
     def _cleanup(sig, frame):
         print("\n[INFO] Interrupted. Closing Chrome...")
+        _stop_remote()
         chrome.terminate()
         sys.exit(1)
     signal.signal(signal.SIGINT, _cleanup)
@@ -577,7 +1557,13 @@ def main() -> None:
         signal.signal(signal.SIGTERM, _cleanup)
 
     print("=" * 60)
-    print("  A Chrome window has opened with the Kia login page.")
+    if args.remote:
+        print("  Open this page in your browser to see the Kia login page:")
+        print(f"    {remote_url}")
+        if args.remote_bind == "127.0.0.1":
+            print(f"  (from another machine: ssh -L {args.remote_port}:localhost:{args.remote_port} <this-server>)")
+    else:
+        print("  A Chrome window has opened with the Kia login page.")
     print("  1. Log in with your Kia Connect credentials")
     print("  2. Complete the CAPTCHA")
     print("  3. The script will detect login automatically")
@@ -590,45 +1576,40 @@ def main() -> None:
     # java.util.NoSuchElementException or code= in URL.
     # Simultaneously accept Enter as manual override.
     login_detected = False
-    import select as _select
+    last_urls = None
+    poller = PollScheduler(LOGIN_TIMEOUT, process=chrome, watch_stdin=True)
 
-    for tick in range(LOGIN_TIMEOUT):
-        # Check if Chrome was closed by the user
-        if chrome.poll() is not None:
-            print("[ERROR] Chrome was closed unexpectedly.")
-            sys.exit(1)
-
-        # Check for manual Enter (non-blocking)
-        if sys.platform == "win32":
-            import msvcrt
-            if msvcrt.kbhit():
-                msvcrt.getwch()  # consume the keypress
-                print("[INFO] Manual confirmation received.")
-                login_detected = True
-                break
-        else:
-            ready, _, _ = _select.select([sys.stdin], [], [], 0)
-            if ready:
-                sys.stdin.readline()
-                print("[INFO] Manual confirmation received.")
-                login_detected = True
-                break
+    while poller.wait():
+        # Poll fast again while the user is moving between pages
+        targets = cdp_get_targets(port)
+        urls = [t.get("url") for t in targets]
+        if urls != last_urls:
+            last_urls = urls
+            poller.kick()
 
         # Check CDP for login signals
-        if cdp_check_login_complete(port):
+        if cdp_check_login_complete(port, targets):
             print("\n[OK] Login detected automatically! Continuing...")
             login_detected = True
             break
 
         # Progress indicator
-        if tick > 0 and tick % 15 == 0:
-            mins_left = (LOGIN_TIMEOUT - tick) // 60
+        if poller.every(15):
+            mins_left = int(poller.remaining() // 60)
             print(f"  Still waiting for login... ({mins_left}m remaining)")
 
-        time.sleep(1)
+    if poller.cancelled == CANCEL_CHROME_EXIT:
+        print("[ERROR] Chrome was closed unexpectedly.")
+        _stop_remote()
+        sys.exit(1)
+
+    if poller.cancelled == CANCEL_ENTER:
+        print("[INFO] Manual confirmation received.")
+        login_detected = True
 
     if not login_detected:
         print("[ERROR] Login timeout (5 minutes). Please try again.")
+        _stop_remote()
         chrome.terminate()
         sys.exit(1)
 
@@ -636,6 +1617,7 @@ def main() -> None:
     print("\n[INFO] Navigating to OAuth redirect URL...")
     if not cdp_navigate(port, redirect_url):
         print("[ERROR] Could not navigate Chrome to redirect URL.")
+        _stop_remote()
         chrome.terminate()
         sys.exit(1)
 
@@ -643,19 +1625,22 @@ def main() -> None:
     print("[INFO] Waiting for authorization code...")
     print(f"[DEBUG] Looking for redirect to: {REDIRECT_URL_FINAL}")
     code = None
-    for i in range(REDIRECT_TIMEOUT):
-        if chrome.poll() is not None:
-            print("[ERROR] Chrome was closed unexpectedly during redirect.")
-            sys.exit(1)
-
-        url = cdp_find_code_url(port, preferred_prefix=REDIRECT_URL_FINAL, debug=(i == 0 or i % 10 == 0))
+    poller = PollScheduler(REDIRECT_TIMEOUT, process=chrome)
+    while poller.wait():
+        progress = poller.every(10)
+        url = cdp_find_code_url(port, preferred_prefix=REDIRECT_URL_FINAL,
+                                debug=(poller.polls == 1 or progress))
         if url:
             code = extract_auth_code(url)
             if code:
                 break
-        time.sleep(1)
-        if i > 0 and i % 10 == 0:
-            print(f"  Still waiting... ({i}s)")
+        if progress:
+            print(f"  Still waiting... ({poller.elapsed():.0f}s)")
+
+    if poller.cancelled == CANCEL_CHROME_EXIT:
+        print("[ERROR] Chrome was closed unexpectedly during redirect.")
+        _stop_remote()
+        sys.exit(1)
 
     if not code:
         print(f"[ERROR] Authorization code not found.")
@@ -665,11 +1650,14 @@ def main() -> None:
         print("  - Network/firewall blocking prd.eu-ccapi.kia.com:8080")
         print("  - Try a different network (e.g. mobile hotspot)")
         print("  - Close all other Chrome windows and try again")
+        _stop_remote()
         chrome.terminate()
         sys.exit(1)
 
     print(f"[OK] Authorization code: {code[:30]}...")
 
+    _stop_remote()
+
     # Close Chrome — no longer needed, code has been captured
     print("[INFO] Closing browser...")
     chrome.terminate()
@@ -734,9 +1722,14 @@ def main() -> None:
     print("    PIN: leave empty")
     print()
 
+    if args.ha_config:
+        if not update_ha_configs(args.ha_config, {args.ha_username: refresh_token}):
+            sys.exit(1)
+
 
 if __name__ == "__main__":
     ensure_dependencies()
+    preload_dependencies()
     _exit_code = 0
     try:
         main()
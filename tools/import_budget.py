@@ -0,0 +1,220 @@
+#!/usr/bin/env python3
+"""
+Startup budget check for KIA_TOKEN.py
+
+Import check (always): imports the script in a fresh interpreter with
+`python -X importtime` and fails if
+  - `import KIA_TOKEN` takes longer than the budget (best of N runs), or
+  - a module that is supposed to be loaded lazily (after Chrome is launched,
+    or only by optional features) is imported by it.
+
+Launch check (--launch): runs the real `__main__` path — ensure_dependencies,
+preload_dependencies, main — until the Chrome Popen, with Popen replaced by
+a stub that records the time and exits. Reports the time from interpreter
+start to Chrome launch, next to the same run with 'requests'/'websocket'
+imported up front (the behaviour before the lazy loading) for comparison.
+Needs requests and websocket-client installed.
+
+Not measured: the PyInstaller .exe (bootloader unpacking, frozen imports).
+
+Usage:
+    python tools/import_budget.py
+    python tools/import_budget.py --launch
+    python tools/import_budget.py --budget-ms 150 --runs 20
+"""
+
+import argparse
+import os
+import socket
+import subprocess
+import sys
+import time
+from pathlib import Path
+from typing import List, Set, Tuple
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+MODULE = "KIA_TOKEN"
+SCRIPT = REPO_ROOT / f"{MODULE}.py"
+
+# Generous enough for slow/noisy CI runners; a local import takes ~30-60ms
+IMPORT_BUDGET_MS = 100
+LAUNCH_BUDGET_MS = 400
+RUNS = 10
+
+# Must not be imported by `import KIA_TOKEN`
+LAZY_MODULES = {
+    "requests",
+    "websocket",
+    "urllib3",
+    "ssl",
+    "socket",
+    "http.server",
+}
+
+# Runs KIA_TOKEN.py as __main__ with Popen/Chrome lookup stubbed out.
+# argv: script, port, "eager" or "lazy"
+LAUNCH_STUB = r"""
+import os, runpy, shutil, subprocess, sys, time
+
+script, port, mode = sys.argv[1:4]
+if mode == "eager":
+    import requests, websocket  # noqa: E401,F401
+
+_popen = subprocess.Popen
+_which = shutil.which
+
+def _stub_popen(cmd, *args, **kwargs):
+    if any(str(a).startswith("--remote-debugging-port=") for a in cmd):
+        # 'requests' in sys.modules is already true while it is still being
+        # imported; the preload thread finishing is what counts
+        thread = getattr(sys.modules["__main__"], "_preload_thread", None)
+        done = int(thread is None or not thread.is_alive())
+        sys.stdout.write(f"\nLAUNCHED {time.time()!r} {done}\n")
+        sys.stdout.flush()
+        os._exit(0)
+    return _popen(cmd, *args, **kwargs)
+
+def _stub_which(name, *args, **kwargs):
+    found = _which(name, *args, **kwargs)
+    return found or ("chrome-stub" if "chrom" in name else None)
+
+subprocess.Popen = _stub_popen
+shutil.which = _stub_which
+sys.argv = [script, "--port", port, "--locale", "en"]
+runpy.run_path(script, run_name="__main__")
+"""
+
+
+def measure_import() -> Tuple[float, Set[str]]:
+    """Import MODULE once; return (cumulative ms, names of imported modules)."""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {MODULE}"],
+        cwd=str(REPO_ROOT),
+        capture_output=True,
+        text=True,
+    )
+    if result.returncode != 0:
+        print(result.stderr)
+        sys.exit(f"[ERROR] 'import {MODULE}' failed")
+
+    # Lines look like: "import time:   self [us] | cumulative | name"
+    total_us = None
+    modules = set()
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        _, cumulative, name = line.split("|", 2)
+        name = name.strip()
+        if not cumulative.strip().isdigit():
+            continue  # header line
+        modules.add(name)
+        if name == MODULE:
+            total_us = int(cumulative)
+
+    if total_us is None:
+        sys.exit(f"[ERROR] No import time reported for {MODULE}")
+    return total_us / 1000, modules
+
+
+def free_port() -> int:
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]
+
+
+def measure_launch(mode: str) -> Tuple[float, bool]:
+    """Run the script up to the Chrome launch; return (ms since spawn, preload finished)."""
+    env = dict(os.environ)
+    env.setdefault("DISPLAY", ":0")  # Chrome is stubbed, only the Linux display check looks at it
+    start = time.time()
+    result = subprocess.run(
+        [sys.executable, "-c", LAUNCH_STUB, str(SCRIPT), str(free_port()), mode],
+        cwd=str(REPO_ROOT),
+        env=env,
+        stdin=subprocess.DEVNULL,
+        capture_output=True,
+        text=True,
+        timeout=60,
+    )
+    for line in result.stdout.splitlines():
+        if line.startswith("LAUNCHED "):
+            _, launched, done = line.split()
+            return (float(launched) - start) * 1000, done == "1"
+
+    print(result.stdout + result.stderr)
+    sys.exit("[ERROR] The script exited before launching Chrome")
+
+
+def check_import(budget_ms: float, runs: int) -> bool:
+    measure_import()  # warm-up: writes __pycache__, fills the OS file cache
+    timings: List[float] = []
+    eager: Set[str] = set()
+    for _ in range(runs):
+        ms, modules = measure_import()
+        timings.append(ms)
+        eager |= modules & LAZY_MODULES
+
+    best = min(timings)
+    print(f"import {MODULE}: best {best:.1f}ms, worst {max(timings):.1f}ms "
+          f"({runs} runs, budget {budget_ms:.0f}ms)")
+
+    ok = True
+    if eager:
+        print(f"[FAIL] Imported at startup but should be lazy: {', '.join(sorted(eager))}")
+        ok = False
+    if best > budget_ms:
+        print(f"[FAIL] Import time over budget by {best - budget_ms:.1f}ms")
+        ok = False
+    return ok
+
+
+def check_launch(budget_ms: float, runs: int) -> bool:
+    import importlib.util
+    missing = [m for m in ("requests", "websocket") if importlib.util.find_spec(m) is None]
+    if missing:
+        sys.exit(f"[ERROR] --launch needs requests and websocket-client (missing: {', '.join(missing)})")
+
+    results = {}
+    for mode in ("lazy", "eager"):
+        measure_launch(mode)  # warm-up
+        results[mode] = [measure_launch(mode) for _ in range(runs)]
+
+    for mode, label in (("lazy", "time to Chrome launch"),
+                        ("eager", "  with deps imported up front")):
+        timings = [ms for ms, _ in results[mode]]
+        print(f"{label}: best {min(timings):.1f}ms, worst {max(timings):.1f}ms ({runs} runs)")
+    best = min(ms for ms, _ in results["lazy"])
+
+    preloaded = sum(done for _, done in results["lazy"])
+    print(f"  background import of requests/websocket finished before launch in {preloaded}/{runs} runs")
+    print(f"  budget {budget_ms:.0f}ms")
+
+    if best > budget_ms:
+        print(f"[FAIL] Time to Chrome launch over budget by {best - budget_ms:.1f}ms")
+        return False
+    return True
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=f"Check the startup budget of {MODULE}.py")
+    parser.add_argument("--budget-ms", type=float, default=IMPORT_BUDGET_MS,
+                        help=f"maximum import time in ms (default: {IMPORT_BUDGET_MS})")
+    parser.add_argument("--launch", action="store_true",
+                        help="also measure the time until Chrome is launched")
+    parser.add_argument("--launch-budget-ms", type=float, default=LAUNCH_BUDGET_MS,
+                        help=f"maximum time to Chrome launch in ms (default: {LAUNCH_BUDGET_MS})")
+    parser.add_argument("--runs", type=int, default=RUNS,
+                        help=f"number of measured runs, best one counts (default: {RUNS})")
+    args = parser.parse_args()
+
+    ok = check_import(args.budget_ms, args.runs)
+    if args.launch:
+        ok = check_launch(args.launch_budget_ms, args.runs) and ok
+
+    if ok:
+        print("[OK] Startup budget met")
+    sys.exit(0 if ok else 1)
+
+
+if __name__ == "__main__":
+    main()